@@ -1,7 +1,14 @@
 import os
+import re
+import sys
 import time
 import json
+import random
+import signal
+import mmap
 import argparse
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 import pyperclip
 from datetime import datetime
 from selenium import webdriver
@@ -9,23 +16,432 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, InvalidSessionIdException
 
 # Optional encryption support
 ENCRYPTION_AVAILABLE = False
 try:
     import base64
     from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
     ENCRYPTION_AVAILABLE = True
 except ImportError:
     # Provide more informative message about missing dependencies
     print("Note: Encryption features will be disabled. To enable encryption, install the cryptography package:")
     print("pip install cryptography")
 
+# Optional faster JSON support for session data
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# Optional C implementation of difflib's SequenceMatcher for content verification
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+# Optional native edit-distance support for exact content similarity
+RAPIDFUZZ_AVAILABLE = False
+try:
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    pass
+
+# Size in bytes of the random nonce prepended to AES-GCM encrypted session data
+AESGCM_NONCE_SIZE = 12
+
+# Size in bytes of the random Scrypt salt stored at the start of encrypted session data
+SESSION_SALT_SIZE = 16
+
+# Scrypt cost parameters for deriving the session key from the password (about 32 MB of memory)
+SCRYPT_N = 2 ** 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Start of session files written by older versions, which used Fernet with a fixed-salt PBKDF2 key
+LEGACY_FERNET_PREFIX = b'gAAAAA'
+
+# Similarity percentage below which verification offers to retry typing
+SIMILARITY_THRESHOLD = 90
+
+# Seconds explicit waits (WebDriverWait) poll for elements; implicit waits stay off
+ELEMENT_WAIT_TIMEOUT = 10
+
+# Minimum number of seconds between periodic session saves while typing
+SESSION_SAVE_INTERVAL = 2.0
+
+# Minimum number of seconds between progress line updates while typing
+PROGRESS_INTERVAL = 0.2
+
+# Weight given to the newest speed sample in the smoothed typing speed
+SPEED_SMOOTHING = 0.1
+
+# Maximum number of batches sent to the browser in one call in batch mode
+BATCHES_PER_CALL = 20
+
+# Upper bound in seconds on the browser-side pacing of one batch call, kept well
+# below Selenium's default 30 second script timeout
+MAX_BATCH_CALL_SECONDS = 10
+
+# Default number of characters written to the editor per execute_script call when typing
+TYPE_CHUNK_SIZE = 100
+
+# Profile directory reused between runs when --profile is not given, so the browser keeps its
+# HTTP cache, compiled scripts and logins from one run to the next
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tinymce_typer")
+
+# Lowercase fragments of the errors Chrome and Firefox report when the profile directory is
+# already in use by another browser
+PROFILE_IN_USE_MARKERS = (
+    "user data directory is already in use",
+    "profile is already in use",
+    "profile is locked",
+    "is already running",
+)
+
+# Chrome switches added with --lean to skip GPU, extension, sync and first-run setup.
+# --no-sandbox is deliberately left out since it weakens the browser's security.
+LEAN_CHROME_ARGUMENTS = (
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+)
+
+# Firefox preferences set with --lean to skip update and default-browser checks
+LEAN_FIREFOX_PREFERENCES = {
+    "app.update.enabled": False,
+    "app.update.auto": False,
+    "browser.shell.checkDefaultBrowser": False,
+}
+
+# Seconds --unattended waits for an editor to appear before typing (default for --page-timeout)
+PAGE_TIMEOUT = 30
+
+# Elements whose presence means an editor has loaded, used in place of the Enter prompt
+# with --unattended
+PAGE_READY_SELECTOR = "iframe[id$='_ifr'], [contenteditable='true'], div.tox-edit-area__iframe"
+
+# Clipboard insertion methods in the order try_clipboard_paste attempts them
+PASTE_METHODS = ('direct', 'html', 'plain')
+
+# Translation table that HTML-escapes plain text and turns newlines into <br> in one pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+    '\n': '<br>',
+})
+
+# Runs of two or more spaces, which browsers would otherwise collapse
+SPACE_RUN_PATTERN = re.compile(r' {2,}')
+
+# Common block/inline tags whose presence marks content as HTML rather than plain text
+HTML_DETECT_PATTERN = re.compile(r'</p>|<br|<div|<span|<h[1-6]')
+
+# Any run of whitespace, collapsed to a single space when comparing content
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Words and the single spaces between them, used as the elements of word-level matching
+WORD_TOKEN_PATTERN = re.compile(r'\S+|\s')
+
+def normalize_whitespace(text):
+    """Collapse every run of whitespace to a single space and trim both ends."""
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+def normalized_prefix_offset(text, normalized_length):
+    """
+    Map a length in normalize_whitespace(text) back to an offset in text.
+    
+    Args:
+        text: The original, unnormalized text
+        normalized_length: Number of leading characters of the normalized text
+        
+    Returns:
+        int: The smallest offset whose normalized prefix is at least that long
+    """
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high) // 2
+        if len(normalize_whitespace(text[:middle])) >= normalized_length:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+def format_plain_text(text):
+    """
+    Convert plain text into HTML that preserves line breaks and runs of spaces.
+    
+    Args:
+        text: The plain text to format
+        
+    Returns:
+        str: HTML-escaped text with newlines as <br> and each space in a run as &nbsp;
+    """
+    return SPACE_RUN_PATTERN.sub(lambda m: '&nbsp;' * len(m.group()), text.translate(HTML_ESCAPE_TABLE))
+
+# Collects every supported editor in the current document as [label, element, is_frame]
+# entries, plus [frame, id] pairs for other same-origin iframes that contain inline
+# editors. Elements matched by more than one selector are only reported once.
+EDITOR_SCAN_SCRIPT = """
+var seen = new Set();
+var found = [];
+function collect(kind, selectors, isFrame) {
+    var count = 0;
+    selectors.forEach(function (selector) {
+        document.querySelectorAll(selector).forEach(function (el) {
+            if (seen.has(el) || (isFrame && el.tagName !== 'IFRAME')) {
+                return;
+            }
+            seen.add(el);
+            count += 1;
+            var label;
+            if (isFrame) {
+                label = kind + ' (' + (el.id || 'unknown') + ')';
+            } else if (kind === 'ContentEditable') {
+                label = kind + ' ' + el.tagName.toLowerCase() + ' (' + count + ')';
+            } else {
+                label = kind + ' (' + count + ')';
+            }
+            found.push([label, el, isFrame]);
+        });
+    });
+}
+collect('TinyMCE', ['div.tox-edit-area__iframe', 'iframe#tinymce_ifr', "iframe[id$='_ifr']", 'div.mce-edit-area iframe'], true);
+collect('CKEditor', ['iframe.cke_wysiwyg_frame'], true);
+collect('Quill Editor', ['.ql-editor'], false);
+collect('ContentEditable', ["[contenteditable='true']"], false);
+var frames = [];
+document.querySelectorAll('iframe').forEach(function (frame) {
+    if (seen.has(frame)) {
+        return;
+    }
+    try {
+        var doc = frame.contentDocument;
+        if (doc && doc.querySelector(".ql-editor, [contenteditable='true']")) {
+            frames.push([frame, frame.id || 'unknown']);
+        }
+    } catch (e) {
+        // Cross-origin frames cannot be inspected
+    }
+});
+return [found, frames];
+"""
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 10 * 1024 * 1024
+
+# Polls until the editor holds more than a trivial amount of HTML or the timeout
+# (in milliseconds) expires, then resolves with whether content appeared.
+WAIT_FOR_CONTENT_SCRIPT = """
+var editor = arguments[0];
+var deadline = Date.now() + arguments[1];
+var done = arguments[arguments.length - 1];
+(function check() {
+    if (editor.innerHTML.length > 10) {
+        done(true);
+    } else if (Date.now() >= deadline) {
+        done(false);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+# Appends each HTML batch to the editor, waiting the given number of milliseconds
+# after every batch, then resolves once all batches have been inserted. Unless the
+# fourth argument is null, the editor's content is first replaced with that HTML.
+APPEND_BATCHES_SCRIPT = """
+var editor = arguments[0];
+var batches = arguments[1];
+var delay = arguments[2];
+var initial = arguments[3];
+var done = arguments[arguments.length - 1];
+if (initial !== null) {
+    editor.innerHTML = initial;
+}
+if (delay <= 0) {
+    batches.forEach(function (batch) {
+        editor.insertAdjacentHTML('beforeend', batch);
+    });
+    done();
+    return;
+}
+var index = 0;
+(function appendNext() {
+    editor.insertAdjacentHTML('beforeend', batches[index]);
+    index += 1;
+    setTimeout(index < batches.length ? appendNext : done, delay);
+})();
+"""
+
+# Returns ['frame', candidates] for elements matching the TinyMCE selectors in arguments[0],
+# otherwise ['editable', element] for the first contenteditable element, otherwise null
+EDITOR_PROBE_SCRIPT = """
+var frames = document.querySelectorAll(arguments[0]);
+if (frames.length) {
+    return ['frame', Array.from(frames)];
+}
+var editable = document.querySelector("[contenteditable='true']");
+return editable ? ['editable', editable] : null;
+"""
+
+# Returns [iframe, id] pairs for every TinyMCE iframe (id ending in '_ifr') on the page
+TINYMCE_IFRAMES_SCRIPT = """
+return Array.from(document.querySelectorAll("iframe[id$='_ifr']")).map(function (frame) {
+    return [frame, frame.id];
+});
+"""
+
+# Fires the input event editors listen for, so script-inserted content is picked up
+# by their change tracking (dirty state, autosave, form sync)
+INPUT_EVENT_SCRIPT = """
+arguments[0].dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+def format_content_slice(content, start, end):
+    """
+    Format content[start:end] as HTML for appending after content[:start].
+    
+    A leading space that continues a run of spaces from the previous slice is
+    written as &nbsp; so the browser does not collapse it.
+    """
+    formatted = format_plain_text(content[start:end])
+    if formatted.startswith(' ') and content[start - 1:start] == ' ':
+        formatted = '&nbsp;' + formatted[1:]
+    return formatted
+
+def dumps_session(data):
+    """Serialize session data to a JSON string, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(',', ':'))
+
+def loads_session(text):
+    """Parse session JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def common_prefix_length(a, b):
+    """Return the length of the common prefix of two strings using C-level slice comparisons."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def content_similarity(expected, actual):
+    """
+    Return how similar two strings are as a percentage.
+    
+    The matching prefix and suffix give a lower bound on the share of matching
+    characters in linear time, and the string lengths and character counts
+    give upper bounds. The quadratic word-level SequenceMatcher only runs when
+    SIMILARITY_THRESHOLD lies between the bounds, where a closer figure
+    decides the outcome. Words that differ are then compared character by
+    character, so the result stays close to a character-level ratio. With
+    rapidfuzz installed, that step is replaced by an exact character-level
+    Indel distance computed in native code. Both strings are expected to be
+    whitespace-normalized.
+    
+    Args:
+        expected: The content that should have been typed
+        actual: The content found in the editor
+        
+    Returns:
+        tuple: (similarity, measured) where similarity is between 0 and 100 and
+               measured is False when the similarity is only a bound showing
+               which side of SIMILARITY_THRESHOLD the content falls on
+    """
+    total = len(expected) + len(actual)
+    if total == 0:
+        return 100.0, True
+    
+    # Strings this different in length cannot reach the threshold
+    upper_bound = 2 * min(len(expected), len(actual)) / total * 100
+    if upper_bound < SIMILARITY_THRESHOLD:
+        return upper_bound, False
+    
+    prefix = common_prefix_length(expected, actual)
+    suffix = min(common_prefix_length(expected[::-1], actual[::-1]), min(len(expected), len(actual)) - prefix)
+    lower_bound = 2 * (prefix + suffix) / total * 100
+    if lower_bound >= SIMILARITY_THRESHOLD:
+        return lower_bound, False
+    
+    # quick_ratio is a linear-time upper bound that already rejects most mismatches
+    quick = SequenceMatcher(None, expected, actual).quick_ratio() * 100
+    if quick < SIMILARITY_THRESHOLD:
+        return quick, False
+    
+    # The common prefix and suffix already match, so only the middles are compared
+    expected_middle = expected[prefix:len(expected) - suffix]
+    actual_middle = actual[prefix:len(actual) - suffix]
+    
+    if RAPIDFUZZ_AVAILABLE:
+        # Indel distance counts insertions and deletions, so the rest is the longest common subsequence
+        middle_total = len(expected_middle) + len(actual_middle)
+        matched = prefix + suffix + (middle_total - Indel.distance(expected_middle, actual_middle)) // 2
+        return 2 * matched / total * 100, True
+    
+    # Match whole words and the spaces between them rather than characters, so the
+    # quadratic matching works on far fewer elements. Matched tokens count by their
+    # characters, and replaced runs of words are matched character by character.
+    expected_tokens = WORD_TOKEN_PATTERN.findall(expected_middle)
+    actual_tokens = WORD_TOKEN_PATTERN.findall(actual_middle)
+    matcher = SequenceMatcher(None, expected_tokens, actual_tokens, autojunk=False)
+    matched = prefix + suffix
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            matched += sum(len(token) for token in expected_tokens[i1:i2])
+        elif tag == 'replace':
+            run_matcher = SequenceMatcher(None, ''.join(expected_tokens[i1:i2]),
+                                          ''.join(actual_tokens[j1:j2]), autojunk=False)
+            matched += sum(block.size for block in run_matcher.get_matching_blocks())
+    return 2 * matched / total * 100, True
+
+def read_text_file(file_path):
+    """
+    Read a UTF-8 text file and return its full content.
+    
+    Large files are memory-mapped and decoded in one step, which avoids holding
+    a separate bytes copy of the file alongside the decoded text.
+    
+    Args:
+        file_path: Path to the file to read
+        
+    Returns:
+        str: The file content with universal newlines applied
+    """
+    if os.path.getsize(file_path) < MMAP_THRESHOLD:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.read()
+    
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped, 'utf-8')
+    
+    # Match the newline translation of text mode reads
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
 class TinyMCETyper:
     def __init__(self, args):
         """
@@ -37,11 +453,25 @@ class TinyMCETyper:
         """
         self.args = args
         self.driver = None                          # Will hold the WebDriver instance
+        self.wait = None                            # Shared WebDriverWait for the driver
         self.session_file = "tinymce_session.json"  # File to save/load progress
         self.progress = 0                           # Current typing progress (characters typed)
         self.editor_found = False                   # Flag to track if editor was successfully located
         self.content = ""                           # Will store the content to be typed
+        self.is_html = False                        # Whether the loaded content contains HTML markup
         self.start_time = None                      # For calculating typing speed and ETA
+        self.last_progress_time = 0.0               # Monotonic time of the last progress update
+        self.last_progress_chars = 0                # Characters typed at the last progress update
+        self.smoothed_speed = 0.0                   # Moving average of typing speed in chars/sec
+        self.last_save_time = 0.0                   # Monotonic time of the last session save
+        self.encryption_key = None                  # Key derived from encryption_password
+        self.encryption_password = None             # Password the cached key and cipher belong to
+        self.encryption_salt = None                 # Scrypt salt the cached key was derived with
+        self.cipher = None                          # AESGCM instance built from encryption_key
+        self.session_writer = None                  # Background thread pool writing the session file
+        self.pending_session_write = None           # Future for the most recently queued session write
+        self.retry_position = None                  # Offset to retype from after a failed verification
+        self.paste_method = None                    # Clipboard method that last worked for this page and file
 
     def setup_browser(self):
         """Set up and return the selected browser driver.
@@ -52,39 +482,98 @@ class TinyMCETyper:
         try:
             if self.args.use_existing:
                 print(f"Connecting to existing {self.args.browser} browser session...")
-                return self.connect_to_existing_browser()
+                if not self.connect_to_existing_browser():
+                    return False
+                self.driver.implicitly_wait(0)
+                self.wait = WebDriverWait(self.driver, ELEMENT_WAIT_TIMEOUT)
+                return True
             else:
                 print(f"Setting up new {self.args.browser} browser...")
-                if self.args.browser == 'chrome':
-                    options = webdriver.ChromeOptions()
-                    options.add_argument('--start-maximized')
-                    
-                    # Profile support
-                    if self.args.profile:
-                        print(f"Using Chrome profile from: {self.args.profile}")
-                        options.add_argument(f"--user-data-dir={self.args.profile}")
-                    
-                    # Initialization for newer Selenium versions
-                    self.driver = webdriver.Chrome(service=webdriver.chrome.service.Service(ChromeDriverManager().install()), options=options)
-                else:  # firefox
-                    options = webdriver.FirefoxOptions()
-                    
-                    # Profile support
-                    if self.args.profile:
-                        print(f"Using Firefox profile from: {self.args.profile}")
-                        options.add_argument("-profile")
-                        options.add_argument(self.args.profile)
-                    
-                    # Initialization for newer Selenium versions
-                    self.driver = webdriver.Firefox(service=webdriver.firefox.service.Service(GeckoDriverManager().install()), options=options)
                 
-                self.driver.implicitly_wait(10)
+                # Without --profile, reuse a profile kept between runs unless --fresh-profile is set
+                profile = self.args.profile
+                default_profile = not profile and not self.args.fresh_profile
+                if default_profile:
+                    profile = os.path.join(DEFAULT_PROFILE_DIR, f"{self.args.browser}_profile")
+                    try:
+                        os.makedirs(profile, exist_ok=True)
+                    except OSError as e:
+                        print(f"Warning: Could not create the saved profile directory: {e}")
+                        profile, default_profile = '', False
+                
+                try:
+                    self.start_browser(profile)
+                except WebDriverException as e:
+                    # Only a saved profile that another browser holds locked gets a second try
+                    message = (e.msg or "").lower()
+                    if not default_profile or not any(marker in message for marker in PROFILE_IN_USE_MARKERS):
+                        raise
+                    print(f"Warning: Could not start with the saved profile: {e.msg}")
+                    print("Starting with a fresh profile instead")
+                    self.start_browser('')
+                
+                # Missing elements should fail fast; waiting is done explicitly via self.wait
+                self.driver.implicitly_wait(0)
+                self.wait = WebDriverWait(self.driver, ELEMENT_WAIT_TIMEOUT)
                 return True
         except WebDriverException as e:
             print(f"Error setting up browser: {e}")
             print("Please make sure the browser is installed correctly.")
             return False
 
+    def start_browser(self, profile):
+        """
+        Start a new browser of the selected type.
+        
+        Args:
+            profile: Path to the browser profile directory, or '' for a fresh profile
+        """
+        if self.args.browser == 'chrome':
+            options = webdriver.ChromeOptions()
+            options.add_argument('--start-maximized')
+            # Background services the typing session never needs
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-features=Translate,MediaRouter')
+            
+            # Skip GPU, extension and first-run setup for a lighter browser if requested
+            if self.args.lean:
+                for argument in LEAN_CHROME_ARGUMENTS:
+                    options.add_argument(argument)
+            
+            # Skip image loading and decoding if requested
+            if self.args.no_images:
+                options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            
+            # Profile support
+            if profile:
+                print(f"Using Chrome profile from: {profile}")
+                options.add_argument(f"--user-data-dir={profile}")
+            
+            # Use the given chromedriver, otherwise Selenium Manager resolves and caches a matching one
+            service = webdriver.chrome.service.Service(self.args.driver_path)
+            self.driver = webdriver.Chrome(service=service, options=options)
+        else:  # firefox
+            options = webdriver.FirefoxOptions()
+            
+            # Skip image loading and decoding if requested
+            if self.args.no_images:
+                options.set_preference("permissions.default.image", 2)
+            
+            # Skip update and default-browser checks for a lighter browser if requested
+            if self.args.lean:
+                for name, value in LEAN_FIREFOX_PREFERENCES.items():
+                    options.set_preference(name, value)
+            
+            # Profile support
+            if profile:
+                print(f"Using Firefox profile from: {profile}")
+                options.add_argument("-profile")
+                options.add_argument(profile)
+            
+            # Use the given geckodriver, otherwise Selenium Manager resolves and caches a matching one
+            service = webdriver.firefox.service.Service(self.args.driver_path)
+            self.driver = webdriver.Firefox(service=service, options=options)
+
     def connect_to_existing_browser(self):
         """Connect to an existing browser session using remote debugging.
         
@@ -104,8 +593,9 @@ class TinyMCETyper:
                 options.add_experimental_option("debuggerAddress", f"localhost:{self.args.debugging_port}")
                 
                 try:
-                    # Connect to the existing Chrome instance
-                    self.driver = webdriver.Chrome(service=webdriver.chrome.service.Service(ChromeDriverManager().install()), options=options)
+                    # Connect to the existing Chrome instance with --driver-path if given, otherwise
+                    # Selenium Manager picks a chromedriver matching the browser
+                    self.driver = webdriver.Chrome(service=webdriver.chrome.service.Service(self.args.driver_path), options=options)
                     
                     # Verify connection by checking browser state
                     self.driver.execute_script("return document.readyState")
@@ -116,18 +606,16 @@ class TinyMCETyper:
                     print(f"Connected to browser - current URL: {current_url}")
                     
                     return True
+                except InvalidSessionIdException:
+                    print("Error: Invalid session. Chrome might have been restarted.")
+                    self.print_remote_debugging_help()
+                    return False
                 except WebDriverException as e:
-                    if "disconnected" in str(e).lower():
+                    if "disconnected" in (e.msg or "").lower():
                         print("Error: Browser connection was lost. Is Chrome still running?")
-                    elif "session" in str(e).lower():
-                        print("Error: Invalid session. Chrome might have been restarted.")
                     else:
                         print(f"Connection error: {e}")
-                        
-                    print("\nMake sure Chrome is running with remote debugging enabled:")
-                    print("1. Close all Chrome instances")
-                    print(f"2. Start Chrome with: chrome.exe --remote-debugging-port={self.args.debugging_port}")
-                    print("3. Then run this script again")
+                    self.print_remote_debugging_help()
                     return False
             
             elif self.args.browser == 'firefox':
@@ -150,7 +638,7 @@ class TinyMCETyper:
                     from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
                     connection = FirefoxRemoteConnection(f"http://localhost:{port}")
                     self.driver = webdriver.Firefox(
-                        service=webdriver.firefox.service.Service(GeckoDriverManager().install()), 
+                        service=webdriver.firefox.service.Service(self.args.driver_path), 
                         options=options,
                         command_executor=connection
                     )
@@ -173,6 +661,22 @@ class TinyMCETyper:
             print(f"Critical connection error: {type(e).__name__}: {e}")
             return False
 
+    @contextlib.contextmanager
+    def in_frame(self, frame):
+        """Switch into the given iframe and always return to the top-level document afterwards."""
+        try:
+            self.driver.switch_to.frame(frame)
+            yield
+        finally:
+            self.driver.switch_to.default_content()
+
+    def print_remote_debugging_help(self):
+        """Print instructions for starting Chrome with remote debugging enabled."""
+        print("\nMake sure Chrome is running with remote debugging enabled:")
+        print("1. Close all Chrome instances")
+        print(f"2. Start Chrome with: chrome.exe --remote-debugging-port={self.args.debugging_port}")
+        print("3. Then run this script again")
+
     def load_content_from_file(self):
         """
         Load the content to be typed from the specified file.
@@ -181,9 +685,9 @@ class TinyMCETyper:
             bool: True if file was successfully loaded, False otherwise
         """
         try:
-            # Open and read the file with UTF-8 encoding to support special characters
-            with open(self.args.file, 'r', encoding='utf-8') as file:
-                self.content = file.read()
+            # Read the file with UTF-8 encoding to support special characters
+            self.content = read_text_file(self.args.file)
+            self.is_html = bool(HTML_DETECT_PATTERN.search(self.content))
             print(f"Successfully loaded content from {self.args.file}")
             return True
         except FileNotFoundError:
@@ -207,16 +711,23 @@ class TinyMCETyper:
             contents = []
             total_size = 0
             
-            for file_path in self.args.files:
+            # Check every path up front so no file is read when any of them is missing
+            missing = [file_path for file_path in self.args.files if not os.path.isfile(file_path)]
+            if missing:
+                for file_path in missing:
+                    print(f"Error: File not found at {file_path}")
+                return False
+            
+            # Read all files concurrently, then report results in the original order
+            with ThreadPoolExecutor(max_workers=min(8, len(self.args.files))) as executor:
+                futures = [executor.submit(read_text_file, file_path) for file_path in self.args.files]
+            
+            for file_path, future in zip(self.args.files, futures):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        file_content = file.read()
-                        contents.append(file_content)
-                        total_size += len(file_content)
+                    file_content = future.result()
+                    contents.append(file_content)
+                    total_size += len(file_content)
                     print(f"Successfully loaded content from {file_path} ({len(file_content)} characters)")
-                except FileNotFoundError:
-                    print(f"Error: File not found at {file_path}")
-                    return False
                 except IOError as e:
                     print(f"Error reading file {file_path}: {e}")
                     return False
@@ -224,8 +735,9 @@ class TinyMCETyper:
             print(f"Total content size: {total_size} characters from {len(contents)} files")
             
             # Combine all content with optional separator
-            separator = self.args.file_separator if hasattr(self.args, 'file_separator') else "\n\n"
+            separator = self.args.file_separator
             self.content = separator.join(contents)
+            self.is_html = bool(HTML_DETECT_PATTERN.search(self.content))
             
             return True
         except Exception as e:
@@ -247,7 +759,7 @@ class TinyMCETyper:
             if self.args.iframe_id:
                 try:
                     # Wait for iframe to be present and switch to it
-                    iframe = WebDriverWait(self.driver, 10).until(
+                    iframe = self.wait.until(
                         EC.presence_of_element_located((By.ID, self.args.iframe_id))
                     )
                     self.driver.switch_to.frame(iframe)
@@ -263,7 +775,7 @@ class TinyMCETyper:
             if self.args.editor_id:
                 try:
                     # Wait for editor to be clickable using provided ID
-                    editor = WebDriverWait(self.driver, 5).until(
+                    editor = self.wait.until(
                         EC.element_to_be_clickable((By.ID, self.args.editor_id))
                     )
                     print(f"Found editor with ID: {self.args.editor_id}")
@@ -281,20 +793,32 @@ class TinyMCETyper:
                         "div.mce-edit-area iframe"    # Older TinyMCE
                     ]
                     
-                    # Try each selector until we find a match
-                    for selector in possible_selectors:
-                        try:
-                            iframe_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            self.driver.switch_to.frame(iframe_element)
-                            editor = self.driver.find_element(By.CSS_SELECTOR, "body")
-                            print(f"Found TinyMCE using selector: {selector}")
-                            break
-                        except (NoSuchElementException, WebDriverException):
-                            continue  # Try next selector if this one fails
+                    # Wait for a TinyMCE frame or, failing that, any contenteditable element,
+                    # checking both in a single browser-side probe per poll
+                    try:
+                        kind, found = self.wait.until(
+                            lambda driver: driver.execute_script(EDITOR_PROBE_SCRIPT, ", ".join(possible_selectors))
+                        )
+                    except TimeoutException:
+                        kind, found = None, None
+                    
+                    if kind == 'frame':
+                        # Use the first candidate that can be switched into
+                        for iframe_element in found:
+                            try:
+                                self.driver.switch_to.frame(iframe_element)
+                                editor = self.driver.find_element(By.CSS_SELECTOR, "body")
+                                print("Found TinyMCE editor frame")
+                                break
+                            except (NoSuchElementException, WebDriverException):
+                                continue  # Try next candidate if this one fails
+                    elif kind == 'editable':
+                        editor = found
+                        print("Found contenteditable element")
                 except Exception as e:
                     print(f"Error while searching for TinyMCE elements: {e}")
             
-            # Method 3: Last resort - look for any contenteditable element
+            # Method 3: Last resort - look for any contenteditable element if no TinyMCE frame worked
             if not editor:
                 try:
                     editor = self.driver.find_element(By.CSS_SELECTOR, "[contenteditable='true']")
@@ -337,68 +861,36 @@ class TinyMCETyper:
         except:
             pass
         
-        # Try TinyMCE
+        # Scan for every supported editor type in a single browser round-trip
         try:
-            # Check for common TinyMCE elements
-            possible_selectors = [
-                "div.tox-edit-area__iframe",  # Modern TinyMCE
-                "iframe#tinymce_ifr",         # Common TinyMCE iframe
-                "iframe[id$='_ifr']",         # Any iframe ending with _ifr
-                "div.mce-edit-area iframe"    # Older TinyMCE
-            ]
-            
-            for selector in possible_selectors:
-                try:
-                    iframe_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for iframe in iframe_elements:
-                        try:
-                            iframe_id = iframe.get_attribute("id") or "unknown"
-                            self.driver.switch_to.frame(iframe)
-                            editor = self.driver.find_element(By.CSS_SELECTOR, "body")
-                            editors.append((f"TinyMCE ({iframe_id})", editor, iframe))
-                            self.driver.switch_to.default_content()
-                        except:
-                            self.driver.switch_to.default_content()
-                except:
-                    continue
-        except Exception as e:
-            print(f"Error while searching for TinyMCE: {e}")
-            self.driver.switch_to.default_content()
+            matches, nested_frames = self.driver.execute_script(EDITOR_SCAN_SCRIPT)
+        except WebDriverException as e:
+            print(f"Error while scanning for editors: {e}")
+            matches, nested_frames = [], []
         
-        # Try CKEditor
-        try:
-            ckeditor_frames = self.driver.find_elements(By.CSS_SELECTOR, "iframe.cke_wysiwyg_frame")
-            for frame in ckeditor_frames:
-                try:
-                    frame_id = frame.get_attribute("id") or "unknown"
-                    self.driver.switch_to.frame(frame)
+        for label, element, is_frame in matches:
+            if not is_frame:
+                editors.append((label, element, None))
+                continue
+                
+            # Iframe based editors keep their content in the frame's body
+            try:
+                with self.in_frame(element):
                     editor = self.driver.find_element(By.CSS_SELECTOR, "body")
-                    editors.append((f"CKEditor ({frame_id})", editor, frame))
-                    self.driver.switch_to.default_content()
-                except:
-                    self.driver.switch_to.default_content()
-        except Exception as e:
-            print(f"Error while searching for CKEditor: {e}")
-            self.driver.switch_to.default_content()
+                editors.append((label, editor, element))
+            except WebDriverException:
+                pass
             
-        # Try Quill editor
-        try:
-            quill_editors = self.driver.find_elements(By.CSS_SELECTOR, ".ql-editor")
-            for idx, editor in enumerate(quill_editors):
-                editors.append((f"Quill Editor ({idx+1})", editor, None))
-        except Exception as e:
-            print(f"Error while searching for Quill Editor: {e}")
-        
-        # Try generic contenteditable elements
-        try:
-            content_editables = self.driver.find_elements(By.CSS_SELECTOR, "[contenteditable='true']")
-            for idx, editor in enumerate(content_editables):
-                # Skip if already found in another editor type
-                if not any(editor == e[1] for e in editors):
-                    tag_name = editor.tag_name
-                    editors.append((f"ContentEditable {tag_name} ({idx+1})", editor, None))
-        except Exception as e:
-            print(f"Error while searching for contenteditable elements: {e}")
+        # Rescan only the same-origin frames known to hold inline editors
+        for frame, frame_id in nested_frames:
+            try:
+                with self.in_frame(frame):
+                    frame_matches, _ = self.driver.execute_script(EDITOR_SCAN_SCRIPT)
+            except WebDriverException:
+                continue
+            for label, element, is_frame in frame_matches:
+                if not is_frame:
+                    editors.append((f"{label} in frame {frame_id}", element, frame))
         
         # Return to original state
         try:
@@ -422,68 +914,129 @@ class TinyMCETyper:
         """
         try:
             print("Attempting clipboard paste with whitespace preservation...")
-            # Save original clipboard content to restore later
-            original_clipboard = pyperclip.paste()
             
-            # Format content with HTML to preserve whitespace
-            formatted_content = self.content.replace('\n', '<br>').replace('  ', '&nbsp;&nbsp;')
+            # Start from the method that worked for this page and file last time, if known
+            first_method = PASTE_METHODS.index(self.paste_method) if self.paste_method in PASTE_METHODS else 0
+            if first_method > 0:
+                print(f"Using the paste method that worked last time: {self.paste_method}")
+            
+            # HTML content is inserted as markup; plain text is formatted to preserve whitespace,
+            # the same way type_formatted_content does
+            formatted_content = self.content if self.is_html else format_plain_text(self.content)
             
             # Method 1: Try direct HTML insertion (most reliable for whitespace)
-            print("Trying direct HTML insertion...")
-            self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, formatted_content)
-            
-            # Verify if content was inserted correctly
-            time.sleep(0.5)
-            editor_content = self.driver.execute_script("return arguments[0].innerHTML;", editor)
-            if editor_content and len(editor_content) > 10:  # Basic check that something was inserted
-                print("Direct HTML insertion successful!")
-                return True
-                
-            # Method 2: Try Ctrl+V paste with formatted HTML
-            print("Direct insertion failed. Trying Ctrl+V with HTML content...")
-            editor.clear()
-            pyperclip.copy(formatted_content)  # Copy the formatted content
-            editor.send_keys(Keys.CONTROL, 'v')
-            time.sleep(1)
-            
-            # Check if paste worked
-            editor_content = self.driver.execute_script("return arguments[0].innerHTML;", editor)
-            if editor_content and len(editor_content) > 10:
-                print("Ctrl+V paste with formatted HTML successful!")
-                return True
-                
-            # Method 3: Try with plain text
-            print("HTML methods failed. Trying with plain text...")
-            editor.clear()
-            pyperclip.copy(self.content)  # Copy original content
-            editor.send_keys(Keys.CONTROL, 'v')
-            time.sleep(1)
-            
-            # Check if this method worked
-            editor_content = self.driver.execute_script("return arguments[0].innerHTML;", editor)
-            if editor_content and len(editor_content) > 10:
-                print("Plain text paste successful!")
-                # Now format the content for whitespace
-                formatted_content = editor_content.replace('\n', '<br>').replace('  ', '&nbsp;&nbsp;')
+            if first_method <= 0:
+                print("Trying direct HTML insertion...")
                 self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, formatted_content)
-                return True
                 
-            # All paste methods failed
-            print("All clipboard paste methods failed. Falling back to character typing.")
-            editor.clear()
-            # Restore original clipboard
-            pyperclip.copy(original_clipboard)
-            return False
+                # Verify if content was inserted correctly
+                if self.wait_for_editor_content(editor, 0.5):  # Basic check that something was inserted
+                    print("Direct HTML insertion successful!")
+                    self.notify_editor_input(editor)
+                    self.remember_paste_method('direct')
+                    return True
+            
+            # The remaining methods go through the system clipboard, so restore it afterwards
+            with self.preserved_clipboard():
+                # Method 2: Try Ctrl+V paste with formatted HTML
+                if first_method <= 1:
+                    print("Trying Ctrl+V with HTML content...")
+                    editor.clear()
+                    pyperclip.copy(formatted_content)  # Copy the formatted content
+                    editor.send_keys(Keys.CONTROL, 'v')
+                    
+                    # Check if paste worked
+                    if self.wait_for_editor_content(editor, 1):
+                        print("Ctrl+V paste with formatted HTML successful!")
+                        self.remember_paste_method('html')
+                        return True
+                    
+                # Method 3: Try with plain text
+                print("Trying Ctrl+V with plain text...")
+                editor.clear()
+                pyperclip.copy(self.content)  # Copy original content
+                editor.send_keys(Keys.CONTROL, 'v')
+                
+                # Check if this method worked
+                if self.wait_for_editor_content(editor, 1):
+                    print("Plain text paste successful!")
+                    # Now rewrite the pasted text with its whitespace preserved
+                    self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, formatted_content)
+                    self.notify_editor_input(editor)
+                    self.remember_paste_method('plain')
+                    return True
+                    
+                # All paste methods failed
+                print("All clipboard paste methods failed. Falling back to character typing.")
+                editor.clear()
+                self.paste_method = None  # Retry every method next time
+                return False
                 
         except Exception as e:
             print(f"Error with clipboard methods: {e}")
-            try:
-                # Attempt to restore original clipboard even if error occurred
-                pyperclip.copy(original_clipboard)
-            except:
-                pass
             return False
 
+    def remember_paste_method(self, method):
+        """
+        Record the paste method that worked and save it with the session.
+        
+        The whole content is in the editor at this point, so the saved progress
+        marks it as complete.
+        
+        Args:
+            method: One of PASTE_METHODS
+        """
+        self.paste_method = method
+        self.progress = len(self.content)
+        if not self.args.no_session:
+            self.save_session(wait=True)
+
+    @contextlib.contextmanager
+    def preserved_clipboard(self):
+        """Save the system clipboard and restore it afterwards, unless --no-clipboard-restore is set."""
+        saved = None
+        if not self.args.no_clipboard_restore:
+            try:
+                saved = pyperclip.paste()
+            except Exception:
+                pass  # Nothing to restore if the clipboard cannot be read
+        try:
+            yield
+        finally:
+            if saved is not None:
+                try:
+                    pyperclip.copy(saved)
+                except Exception:
+                    pass
+
+    def wait_for_editor_content(self, editor, timeout):
+        """
+        Wait inside the browser until the editor contains inserted content.
+        
+        Only a boolean crosses the WebDriver connection, and the wait ends as
+        soon as content appears instead of always sleeping for the full timeout.
+        
+        Args:
+            editor: The editor WebElement to check
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            bool: True if the editor holds content, False if the timeout expired
+        """
+        return bool(self.driver.execute_async_script(WAIT_FOR_CONTENT_SCRIPT, editor, int(timeout * 1000)))
+
+    def notify_editor_input(self, editor):
+        """
+        Tell the editor its content changed after it was written through the DOM.
+        
+        Args:
+            editor: The editor WebElement that was written to
+        """
+        try:
+            self.driver.execute_script(INPUT_EVENT_SCRIPT, editor)
+        except WebDriverException as e:
+            print(f"Warning: Could not notify the editor of the new content: {e}")
+
     def type_formatted_content(self, editor, content):
         """
         Type content while preserving HTML formatting and whitespace.
@@ -497,20 +1050,27 @@ class TinyMCETyper:
             bool: True if formatting and typing was successful, False otherwise
         """
         try:
-            # Check if content appears to have HTML formatting by looking for common HTML tags
-            if '<' in content and '>' in content and ('</p>' in content or '<br' in content or '<div' in content):
+            # Reuse the detection done at load time unless different content was passed in
+            if content is self.content:
+                is_html = self.is_html
+            else:
+                is_html = bool(HTML_DETECT_PATTERN.search(content))
+            
+            if is_html:
                 print("Detected HTML formatting in content, preserving format...")
                 # Use JavaScript to set innerHTML directly instead of typing character by character
                 self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, content)
+                self.notify_editor_input(editor)
                 return True
             else:
                 # For non-HTML content, preserve whitespace by converting to HTML format
                 print("Preserving whitespace and line breaks in plain text content...")
                 # Replace newlines with <br> tags and preserve spaces
-                formatted_content = content.replace('\n', '<br>').replace('  ', '&nbsp;&nbsp;')
+                formatted_content = format_plain_text(content)
                 
                 # Use JavaScript to set innerHTML directly with whitespace preserved
                 self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, formatted_content)
+                self.notify_editor_input(editor)
                 return True
         except Exception as e:
             print(f"Error while handling formatted content: {e}")
@@ -530,75 +1090,80 @@ class TinyMCETyper:
         """
         try:
             print("\nStarting to type content...")
-            print(f"Using typing delay of {self.args.type_delay} seconds between characters")
+            human_typing = self.args.human_typing
+            if human_typing:
+                print(f"Using typing delay of {self.args.type_delay} seconds between characters")
             
             # Resume from saved progress if available
             start_pos = self.progress
             if start_pos > 0:
                 print(f"Resuming from previous session at character {start_pos}")
-                
-                # Get text already typed
-                existing_text = content[:start_pos]
-                # Get remaining text to type
-                remaining_text = content[start_pos:]
-                
-                # Set existing text directly using JavaScript with whitespace preservation
-                if len(existing_text) > 0:
-                    # Replace newlines with <br> tags to preserve line breaks
-                    formatted_existing = existing_text.replace('\n', '<br>').replace('  ', '&nbsp;&nbsp;')
-                    self.driver.execute_script(f"arguments[0].innerHTML = arguments[1];", editor, formatted_existing)
-                    
-                content = remaining_text
-            else:
-                # Clear existing content if any
-                editor.clear()
+            
+            # The first write replaces the editor's content, restoring the text already typed
+            # when resuming, so the editor never needs a separate clear
+            initial_html = format_plain_text(content[:start_pos])
+            write_script = "arguments[0].innerHTML = arguments[1];"
             
             # Record start time for progress estimation
-            self.start_time = time.time()
+            self.start_progress()
+            
+            # Type the content in chunks, so each Selenium round-trip covers many characters.
+            # Without --human-typing the whole remainder is written in a single call.
+            content_length = len(content)
+            total_chars = content_length - start_pos
+            if human_typing:
+                chunk_size = max(1, self.args.type_chunk_size)
+                type_delay = self.args.type_delay
+            else:
+                chunk_size = max(1, total_chars)
+                type_delay = 0
             
-            # Type the content character by character with special handling for whitespace
-            total_chars = len(content)
-            current_html = ""
+            # Bind loop invariants to locals to avoid repeated attribute lookups
+            execute_script = self.driver.execute_script
             
-            for i, char in enumerate(content):
-                current_pos = start_pos + i
-                
-                # Special handling for whitespace characters
-                if char == '\n':
-                    # Add a line break for newlines
-                    current_html += '<br>'
-                elif char == ' ' and content[i-1:i] == ' ':
-                    # Use non-breaking space for consecutive spaces
-                    current_html += '&nbsp;'
-                else:
-                    # Escape special characters for JavaScript
-                    escaped_char = char.replace("'", "\\'").replace('"', '\\"')
-                    current_html += escaped_char
+            # Keystroke delays accumulate against a deadline so scheduler overshoot does not drift
+            deadline = time.perf_counter()
+            
+            if total_chars <= 0:
+                execute_script(write_script, editor, initial_html)
+            
+            # Walk absolute offsets into content, so resuming never copies the remaining text
+            for i in range(start_pos, content_length, chunk_size):
+                chunk_end = min(i + chunk_size, content_length)
                 
-                # Update the editor's content
-                self.driver.execute_script(f"arguments[0].innerHTML = arguments[1];", editor, current_html)
+                # After the first write, append only the new chunk so the editor never
+                # reparses what is already typed
+                execute_script(write_script, editor, initial_html + format_content_slice(content, i, chunk_end))
+                initial_html = ''
+                write_script = "arguments[0].insertAdjacentHTML('beforeend', arguments[1]);"
                 
-                # Save progress periodically (every 100 characters)
-                if current_pos % 100 == 0:
-                    self.progress = current_pos
-                    self.save_session()
+                # Save progress periodically (at most every SESSION_SAVE_INTERVAL seconds)
+                self.progress = chunk_end
+                self.save_session_periodically()
                 
-                # Show progress updates (every 10 characters)
-                if i % 10 == 0 or i == total_chars - 1:
-                    self.show_progress(i, total_chars, start_pos)
+                # Show progress updates
+                self.show_progress(chunk_end - start_pos - 1, total_chars, start_pos)
                 
-                # Wait between characters to simulate typing
-                time.sleep(self.args.type_delay)
+                # Wait for the combined keystroke delay of the chunk, jittered to simulate typing
+                if type_delay:
+                    deadline += type_delay * (chunk_end - i) * random.uniform(0.8, 1.2)
+                    remaining = deadline - time.perf_counter()
+                    if remaining > 0:
+                        time.sleep(remaining)
             
             # Final progress update
             self.progress = start_pos + total_chars
-            self.save_session()
+            self.save_session(wait=True)
+            self.notify_editor_input(editor)
             
             print("\nFinished typing content!")
             return True
+        except KeyboardInterrupt:
+            self.save_session(wait=True)  # Keep progress made since the last periodic save
+            raise
         except Exception as e:
             print(f"\nError while typing content: {e}")
-            self.save_session()  # Save session on error too
+            self.save_session(wait=True)  # Save session on error too
             return False
 
     def type_content_batched(self, editor, content):
@@ -615,72 +1180,76 @@ class TinyMCETyper:
             print("\nStarting to type content using batch insertion...")
             
             # Get batch size from args or use default
-            batch_size = self.args.batch_size if hasattr(self.args, 'batch_size') else 50
-            batch_delay = self.args.batch_delay if hasattr(self.args, 'batch_delay') else 0.1
+            batch_size = self.args.batch_size
+            # Batches are only paced when a delay was requested; otherwise each call returns
+            # as soon as the browser has inserted its batches
+            batch_delay = self.args.batch_delay or 0
             
-            print(f"Using batch size of {batch_size} characters with {batch_delay}s delay between batches")
+            if batch_delay > 0:
+                print(f"Using batch size of {batch_size} characters with {batch_delay}s delay between batches")
+            else:
+                print(f"Using batch size of {batch_size} characters with no delay between batches")
             
             # Resume from saved progress if available
             start_pos = self.progress
             if start_pos > 0:
                 print(f"Resuming from previous session at character {start_pos}")
-                existing_text = content[:start_pos]
-                remaining_text = content[start_pos:]
-                if len(existing_text) > 0:
-                    # Format existing text with whitespace preservation
-                    formatted_existing = existing_text.replace('\n', '<br>').replace('  ', '&nbsp;&nbsp;')
-                    self.driver.execute_script(f"arguments[0].innerHTML = arguments[1];", editor, formatted_existing)
-                content = remaining_text
-            else:
-                editor.clear()
+            
+            # The first call replaces the editor's content with the text already typed (empty
+            # when starting over) before appending, so the editor never needs a separate clear
+            initial_html = format_plain_text(content[:start_pos])
             
             # Record start time for progress estimation
-            self.start_time = time.time()
+            self.start_progress()
             
-            # Process and type the content in batches with whitespace preservation
-            total_chars = len(content)
-            current_html = self.driver.execute_script("return arguments[0].innerHTML;", editor) or ""
+            # Process and type the content in batches with whitespace preservation. Batches are
+            # sliced straight out of content at start_pos + offset, so the remaining text is never copied.
+            total_chars = len(content) - start_pos
+            execute_async_script = self.driver.execute_async_script
+            if total_chars <= 0:
+                self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, initial_html)
             
-            for i in range(0, total_chars, batch_size):
-                current_pos = start_pos + i
-                end_pos = min(i + batch_size, total_chars)
-                batch = content[i:end_pos]
-                
-                # Format the batch with whitespace preservation
-                formatted_batch = ""
-                for char in batch:
-                    if char == '\n':
-                        formatted_batch += '<br>'
-                    elif char == ' ' and formatted_batch.endswith(' '):
-                        formatted_batch += '&nbsp;'
-                    else:
-                        formatted_batch += char
+            # Send several batches per call; the browser appends them with batch_delay between each
+            batches_per_call = BATCHES_PER_CALL
+            if batch_delay > 0:
+                batches_per_call = max(1, min(BATCHES_PER_CALL, int(MAX_BATCH_CALL_SECONDS / batch_delay)))
+            group_size = batch_size * batches_per_call
+            delay_ms = int(batch_delay * 1000)
+            
+            for i in range(0, total_chars, group_size):
+                end_pos = min(i + group_size, total_chars)
                 
-                # Update current HTML content
-                current_html += formatted_batch
+                # Format each batch in this group with whitespace preservation
+                group_end = start_pos + end_pos
+                formatted_batches = [
+                    format_content_slice(content, j, min(j + batch_size, group_end))
+                    for j in range(start_pos + i, group_end, batch_size)
+                ]
                 
-                # Insert the formatted batch
-                self.driver.execute_script("arguments[0].innerHTML = arguments[1];", editor, current_html)
+                # Append only the new batches to the editor's existing content
+                execute_async_script(APPEND_BATCHES_SCRIPT, editor, formatted_batches, delay_ms, initial_html)
+                initial_html = None
                 
-                # Save progress periodically
-                self.progress = current_pos + (end_pos - i)
-                if self.progress % (batch_size * 5) == 0:
-                    self.save_session()
+                # Save progress periodically (at most every SESSION_SAVE_INTERVAL seconds)
+                self.progress = start_pos + end_pos
+                self.save_session_periodically()
                 
                 # Show progress
-                self.show_progress(i + (end_pos - i), total_chars, start_pos)
-                
-                time.sleep(batch_delay)  # Shorter delay between batches
+                self.show_progress(end_pos - 1, total_chars, start_pos)
             
             # Final progress update
             self.progress = start_pos + total_chars
-            self.save_session()
+            self.save_session(wait=True)
+            self.notify_editor_input(editor)
             
             print("\nFinished typing content!")
             return True
+        except KeyboardInterrupt:
+            self.save_session(wait=True)  # Keep progress made since the last periodic save
+            raise
         except Exception as e:
             print(f"\nError while typing content in batches: {e}")
-            self.save_session()  # Save session on error too
+            self.save_session(wait=True)  # Save session on error too
             return False
 
     def verify_typed_content(self, editor, expected_content):
@@ -694,12 +1263,23 @@ class TinyMCETyper:
             bool: True if content verification passed, False otherwise
         """
         try:
+            # HTML content is compared as markup; plain text only needs the rendered text,
+            # which skips serializing tags and entities for the comparison to strip again
+            if expected_content is self.content:
+                is_html = self.is_html
+            else:
+                is_html = bool(HTML_DETECT_PATTERN.search(expected_content))
+            
             # Get the current content from the editor
-            actual_content = self.driver.execute_script("return arguments[0].innerHTML;", editor)
+            if is_html:
+                actual_content = self.driver.execute_script("return arguments[0].innerHTML;", editor)
+            else:
+                actual_content = self.driver.execute_script(
+                    "return arguments[0].innerText || arguments[0].textContent;", editor)
             
             # Clean up whitespace for comparison
-            expected_clean = ' '.join(expected_content.split())
-            actual_clean = ' '.join(actual_content.split())
+            expected_clean = normalize_whitespace(expected_content)
+            actual_clean = normalize_whitespace(actual_content)
             
             # Check if the content matches
             if expected_clean in actual_clean:
@@ -710,65 +1290,125 @@ class TinyMCETyper:
                 print("Content may not have been entered correctly")
                 
                 # Calculate similarity percentage
-                import difflib
-                similarity = difflib.SequenceMatcher(None, expected_clean, actual_clean).ratio() * 100
-                print(f"Content similarity: {similarity:.1f}%")
+                similarity, measured = content_similarity(expected_clean, actual_clean)
+                if measured:
+                    print(f"Content similarity: {similarity:.1f}%")
+                elif similarity < SIMILARITY_THRESHOLD:
+                    print(f"Content similarity: below {SIMILARITY_THRESHOLD}%")
+                else:
+                    print(f"Content similarity: at least {similarity:.1f}%")
                 
-                # If significant mismatch, offer retry
-                if similarity < 90 and not self.args.no_verification:
+                # If significant mismatch, offer to retype from where the content stops matching
+                if similarity < SIMILARITY_THRESHOLD and not self.args.no_verification:
+                    if not self.insertion_resumes():
+                        print("Retyping from the mismatch is not supported for this content and insertion method")
+                        return False
                     response = input("Would you like to retry typing? (y/n): ")
-                    return response.lower() != 'y'
+                    if response.lower() == 'y':
+                        matched = common_prefix_length(expected_clean, actual_clean)
+                        self.retry_position = normalized_prefix_offset(expected_content, matched)
+                        return False
+                    return True
                 
                 return False
         except Exception as e:
             print(f"Error during content verification: {e}")
             return False
 
+    def start_progress(self):
+        """Record the typing start time and reset the speed tracking used for the ETA."""
+        self.start_time = time.monotonic()
+        self.last_progress_time = self.start_time
+        self.last_progress_chars = 0
+        self.smoothed_speed = 0.0
+
     def show_progress(self, current, total, offset=0):
         """
         Display progress information and estimated time remaining.
         
+        The line is redrawn at most every PROGRESS_INTERVAL seconds, plus once on
+        completion. The speed is an exponential moving average of the rate between
+        updates, so the ETA follows recent typing speed instead of the whole-run average.
+        
         Args:
             current: Current character index
             total: Total number of characters
             offset: Starting position offset (for resumed sessions)
         """
+        now = time.monotonic()
+        interval = now - self.last_progress_time
+        if current + 1 < total and interval < PROGRESS_INTERVAL:
+            return
+        
         progress_pct = (current + 1) / total * 100
         
+        # Update the smoothed typing speed from the characters typed since the last update
+        if self.start_time and interval > 0 and current > self.last_progress_chars:
+            speed = (current - self.last_progress_chars) / interval
+            if self.smoothed_speed:
+                self.smoothed_speed += SPEED_SMOOTHING * (speed - self.smoothed_speed)
+            else:
+                self.smoothed_speed = speed
+            self.last_progress_time = now
+            self.last_progress_chars = current
+        
         # Calculate speed and ETA
         if self.start_time and current > 0:
-            elapsed = time.time() - self.start_time
-            chars_per_sec = current / elapsed if elapsed > 0 else 0
+            chars_per_sec = self.smoothed_speed
             remaining_chars = total - current
-            remaining_time = remaining_chars / chars_per_sec if chars_per_sec > 0 else 0
             
-            # Format remaining time in minutes and seconds
-            remaining_mins = int(remaining_time // 60)
-            remaining_secs = int(remaining_time % 60)
-            eta = f"{remaining_mins}m {remaining_secs}s"
+            # Until a first speed sample exists there is nothing to base an estimate on
+            if chars_per_sec > 0:
+                remaining_time = remaining_chars / chars_per_sec
+                
+                # Format remaining time in minutes and seconds
+                remaining_mins = int(remaining_time // 60)
+                remaining_secs = int(remaining_time % 60)
+                eta = f"{remaining_mins}m {remaining_secs}s"
+            else:
+                eta = "unknown"
             
             # Print progress with speed and ETA information
-            print(f"Progress: {progress_pct:.1f}% ({current+1}/{total} chars) | Speed: {chars_per_sec:.1f} chars/sec | ETA: {eta}", end='\r')
+            line = f"Progress: {progress_pct:.1f}% ({current+1}/{total} chars) | Speed: {chars_per_sec:.1f} chars/sec | ETA: {eta}"
         else:
             # Simple progress display if timing info is not available
-            print(f"Progress: {progress_pct:.1f}% ({current+1}/{total} chars)", end='\r')
+            line = f"Progress: {progress_pct:.1f}% ({current+1}/{total} chars)"
+        
+        # Overwrite the current console line in a single write
+        sys.stdout.write(line + '\r')
+        sys.stdout.flush()
             
-    def get_encryption_key(self, password):
-        """Generate an encryption key from password."""
+    def get_encryption_key(self, password, salt=None):
+        """
+        Derive an encryption key from the password with Scrypt.
+        
+        The key derived for the same password and salt is reused. Without a salt,
+        the salt of the current key is kept, or a new random one is generated.
+        
+        Args:
+            password: The session password
+            salt: Salt read from an encrypted session file, if any
+            
+        Returns:
+            bytes: The 32-byte key, or None if it could not be derived
+        """
         if not ENCRYPTION_AVAILABLE:
             return None
+        
+        if salt is None:
+            salt = self.encryption_salt or os.urandom(SESSION_SALT_SIZE)
+        if (self.encryption_key is not None and password == self.encryption_password
+                and salt == self.encryption_salt):
+            return self.encryption_key
             
         try:
-            # Use password to derive a key
-            password_bytes = password.encode()
-            salt = b'TinyMCETyperSalt'  # Fixed salt - could be made configurable
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
+            # Use password to derive a key, with a salt stored alongside the data
+            kdf = Scrypt(salt=salt, length=32, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+            key = kdf.derive(password.encode())
+            self.encryption_key = key
+            self.encryption_password = password
+            self.encryption_salt = salt
+            self.cipher = AESGCM(key)
             return key
         except Exception as e:
             print(f"Error generating encryption key: {e}")
@@ -787,12 +1427,12 @@ class TinyMCETyper:
                 
             # Convert data to string if it's not already
             if isinstance(data, dict):
-                data = json.dumps(data)
+                data = dumps_session(data)
                 
-            # Encrypt the data
-            f = Fernet(key)
-            encrypted_data = f.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted_data).decode()
+            # Encrypt the data with AES-GCM, storing the salt and random nonce in front of the ciphertext
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            encrypted_data = self.cipher.encrypt(nonce, data.encode(), None)
+            return base64.urlsafe_b64encode(self.encryption_salt + nonce + encrypted_data).decode()
         except Exception as e:
             print(f"Encryption failed: {e}")
             return data
@@ -804,31 +1444,101 @@ class TinyMCETyper:
             return encrypted_data
             
         try:
-            key = self.get_encryption_key(password)
+            decoded_data = base64.urlsafe_b64decode(encrypted_data.encode())
+            if decoded_data.startswith(LEGACY_FERNET_PREFIX):
+                return self.decrypt_legacy_data(decoded_data, password)
+            
+            # Split off the salt and nonce stored in front of the ciphertext
+            salt = decoded_data[:SESSION_SALT_SIZE]
+            nonce_end = SESSION_SALT_SIZE + AESGCM_NONCE_SIZE
+            nonce, ciphertext = decoded_data[SESSION_SALT_SIZE:nonce_end], decoded_data[nonce_end:]
+            
+            key = self.get_encryption_key(password, salt)
             if not key:
                 return encrypted_data
                 
-            # Decrypt the data
-            f = Fernet(key)
-            decoded_data = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted_data = f.decrypt(decoded_data).decode()
+            decrypted_data = self.cipher.decrypt(nonce, ciphertext, None).decode()
             return decrypted_data
         except Exception as e:
             print(f"Decryption failed: {e}")
             return encrypted_data
 
-    def save_session(self):
-        """Save current session data to file with optional encryption."""
+    def decrypt_legacy_data(self, token, password):
+        """
+        Decrypt a session saved by older versions with Fernet and a fixed-salt PBKDF2 key.
+        
+        The session is written in the current format the next time it is saved.
+        
+        Args:
+            token: The Fernet token decoded from the session file
+            password: The session password
+            
+        Returns:
+            str: The decrypted session JSON
+        """
+        print("Session was saved in the old encryption format, converting it on the next save")
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=b'TinyMCETyperSalt',
+            iterations=100000,
+        )
+        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        return Fernet(key).decrypt(token).decode()
+
+    def save_session_periodically(self):
+        """Save the session if SESSION_SAVE_INTERVAL seconds have passed since the last save."""
+        if time.monotonic() - self.last_save_time >= SESSION_SAVE_INTERVAL:
+            self.save_session()
+
+    def write_session_file(self, text):
+        """
+        Replace the session file with text atomically.
+        
+        The text goes to a temporary file that is then renamed over the session
+        file, so an interrupted save never leaves a truncated session behind.
+        """
+        temp_file = self.session_file + ".tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_file, self.session_file)
+        except Exception as e:
+            print(f"Warning: Failed to save session: {e}")
+
+    def queue_session_write(self, text, wait=False):
+        """
+        Hand session file text to the background writer so typing never blocks on disk I/O.
+        
+        Args:
+            text: The serialized session data to write
+            wait: Block until the write has completed
+        """
+        if self.session_writer is None:
+            self.session_writer = ThreadPoolExecutor(max_workers=1)
+        self.pending_session_write = self.session_writer.submit(self.write_session_file, text)
+        if wait:
+            self.pending_session_write.result()
+
+    def save_session(self, wait=False):
+        """
+        Save current session data to file with optional encryption.
+        
+        Args:
+            wait: Block until the session file has been written
+        """
+        self.last_save_time = time.monotonic()
         try:
             session_data = {
                 "url": self.args.url,
                 "file": self.args.file,
                 "progress": self.progress,
+                "paste_method": self.paste_method,
                 "timestamp": datetime.now().isoformat()
             }
             
             # Check if encryption is requested and available
-            if hasattr(self.args, 'encrypt') and self.args.encrypt:
+            if self.args.encrypt:
                 if ENCRYPTION_AVAILABLE:
                     if not hasattr(self, 'password'):
                         self.password = input("Enter password for session encryption: ")
@@ -836,76 +1546,86 @@ class TinyMCETyper:
                     # Encrypt the session data
                     encrypted_data = self.encrypt_data(session_data, self.password)
                     
-                    with open(self.session_file, 'w', encoding='utf-8') as f:
-                        f.write(encrypted_data)
+                    self.queue_session_write(encrypted_data, wait)
                     print("Session saved with encryption")
                 else:
                     print("Warning: Encryption requested but not available. Session saved unencrypted.")
-                    with open(self.session_file, 'w', encoding='utf-8') as f:
-                        json.dump(session_data, f)
+                    self.queue_session_write(dumps_session(session_data), wait)
             else:
                 # Save unencrypted
-                with open(self.session_file, 'w', encoding='utf-8') as f:
-                    json.dump(session_data, f)
+                self.queue_session_write(dumps_session(session_data), wait)
         except Exception as e:
             print(f"Warning: Failed to save session: {e}")
 
     def load_session(self):
         """Load previous session data if available with optional decryption."""
         try:
-            if os.path.exists(self.session_file):
-                # Try to determine if file is encrypted by attempting to parse as JSON
-                encrypted = False
-                with open(self.session_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    try:
-                        session_data = json.loads(content)
-                    except json.JSONDecodeError:
-                        # File may be encrypted
-                        encrypted = True
+            # Read the file once, then determine if it is encrypted by attempting to parse as JSON
+            try:
+                content = read_text_file(self.session_file)
+            except FileNotFoundError:
+                return  # No previous session
+            
+            encrypted = False
+            try:
+                session_data = loads_session(content)
+            except json.JSONDecodeError:
+                # File may be encrypted
+                encrypted = True
                 
-                if encrypted and ENCRYPTION_AVAILABLE:
-                    if not hasattr(self, 'password'):
-                        self.password = input("Session appears encrypted. Enter password to decrypt: ")
+            if encrypted and ENCRYPTION_AVAILABLE:
+                if not hasattr(self, 'password'):
+                    self.password = input("Session appears encrypted. Enter password to decrypt: ")
                     
-                    # Decrypt the session data
-                    with open(self.session_file, 'r', encoding='utf-8') as f:
-                        encrypted_data = f.read()
-                        
-                    decrypted_data = self.decrypt_data(encrypted_data, self.password)
-                    try:
-                        session_data = json.loads(decrypted_data)
-                        print("Session decrypted successfully")
-                    except json.JSONDecodeError:
-                        print("Decryption failed. Incorrect password or corrupted file.")
-                        return
-                elif encrypted and not ENCRYPTION_AVAILABLE:
-                    print("Session appears encrypted but decryption support is not available.")
-                    print("Install the cryptography package to enable decryption.")
+                # Decrypt the session data
+                decrypted_data = self.decrypt_data(content, self.password)
+                try:
+                    session_data = loads_session(decrypted_data)
+                    print("Session decrypted successfully")
+                except json.JSONDecodeError:
+                    print("Decryption failed. Incorrect password or corrupted file.")
                     return
-                else:
-                    # File is not encrypted
-                    with open(self.session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
+            elif encrypted and not ENCRYPTION_AVAILABLE:
+                print("Session appears encrypted but decryption support is not available.")
+                print("Install the cryptography package to enable decryption.")
+                return
                 
-                # Check if session is for the same URL and file
-                if session_data["url"] == self.args.url and session_data["file"] == self.args.file:
-                    self.progress = session_data["progress"]
-                    print(f"Found saved session from {session_data['timestamp']}")
-                    print(f"Progress: {self.progress} characters typed")
+            # Check if session is for the same URL and file
+            if session_data["url"] == self.args.url and session_data["file"] == self.args.file:
+                self.progress = session_data["progress"]
+                self.paste_method = session_data.get("paste_method")
+                print(f"Found saved session from {session_data['timestamp']}")
+                print(f"Progress: {self.progress} characters typed")
                     
-                    if self.args.reset:
-                        print("Reset flag provided, starting from beginning")
+                if self.args.reset:
+                    print("Reset flag provided, starting from beginning")
+                    self.progress = 0
+                else:
+                    response = input("Resume from saved progress? (y/n): ")
+                    if response.lower() != 'y':
+                        print("Starting from beginning")
                         self.progress = 0
-                    else:
-                        response = input("Resume from saved progress? (y/n): ")
-                        if response.lower() != 'y':
-                            print("Starting from beginning")
-                            self.progress = 0
         except Exception as e:
             print(f"Warning: Failed to load session: {e}")
             self.progress = 0
 
+    def focus_editor_in_frame(self, iframe):
+        """
+        Switch into a TinyMCE iframe and focus the editor body inside it.
+        
+        Args:
+            iframe: The TinyMCE iframe WebElement
+            
+        Returns:
+            WebElement: The focused editor body
+        """
+        self.driver.switch_to.frame(iframe)
+        editor = self.driver.find_element(By.CSS_SELECTOR, "body")
+        self.driver.execute_script("arguments[0].focus();", editor)
+        print("Successfully focused on the editor")
+        self.editor_found = True
+        return editor
+
     def handle_multiple_editors(self):
         """
         Find and manage multiple TinyMCE editors on the page.
@@ -923,8 +1643,9 @@ class TinyMCETyper:
             except:
                 pass
             
-            # Find all potential TinyMCE instances by looking for iframes with ID ending in '_ifr'
-            tinymce_iframes = self.driver.find_elements(By.CSS_SELECTOR, "iframe[id$='_ifr']")
+            # Find all potential TinyMCE instances by looking for iframes with ID ending in '_ifr',
+            # fetching their IDs in the same round-trip
+            tinymce_iframes = self.driver.execute_script(TINYMCE_IFRAMES_SCRIPT)
             
             # If no editors found, fall back to standard detection
             if not tinymce_iframes or len(tinymce_iframes) == 0:
@@ -933,14 +1654,15 @@ class TinyMCETyper:
             
             print(f"Found {len(tinymce_iframes)} potential TinyMCE editors")
             
-            # If only one editor, use standard method
+            # If only one editor, use the iframe already found unless explicit IDs were given
             if len(tinymce_iframes) == 1:
-                return self.find_and_focus_editor()
+                if self.args.iframe_id or self.args.editor_id:
+                    return self.find_and_focus_editor()
+                return self.focus_editor_in_frame(tinymce_iframes[0][0])
             
             # Multiple editors found - let user choose
             print("\nMultiple editors found. Please select which one to use:")
-            for i, iframe in enumerate(tinymce_iframes):
-                iframe_id = iframe.get_attribute("id")
+            for i, (_, iframe_id) in enumerate(tinymce_iframes):
                 print(f"{i+1}. Editor in iframe: {iframe_id}")
             
             try:
@@ -950,13 +1672,7 @@ class TinyMCETyper:
                     return self.find_and_focus_editor()
                 elif 1 <= choice <= len(tinymce_iframes):
                     # Focus the selected editor
-                    chosen_iframe = tinymce_iframes[choice-1]
-                    self.driver.switch_to.frame(chosen_iframe)
-                    editor = self.driver.find_element(By.CSS_SELECTOR, "body")
-                    self.driver.execute_script("arguments[0].focus();", editor)
-                    print(f"Successfully focused on editor {choice}")
-                    self.editor_found = True
-                    return editor
+                    return self.focus_editor_in_frame(tinymce_iframes[choice-1][0])
                 else:
                     print("Invalid choice, using standard editor detection")
                     return self.find_and_focus_editor()
@@ -968,17 +1684,221 @@ class TinyMCETyper:
             print(f"Error detecting multiple editors: {e}")
             return self.find_and_focus_editor()
 
-    def run(self):
-        """Main execution method."""
-        if not self.setup_browser():
+    def wait_for_page_ready(self):
+        """
+        Wait until an editor element is present on the page, up to --page-timeout seconds.
+        
+        Returns:
+            bool: True if an editor element appeared, False if the wait timed out
+        """
+        print(f"\nWaiting up to {self.args.page_timeout} seconds for an editor to load...")
+        try:
+            WebDriverWait(self.driver, self.args.page_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PAGE_READY_SELECTOR)))
+            print("Editor element found on the page")
+            return True
+        except TimeoutException:
+            print("Warning: No editor appeared before the timeout, trying detection anyway")
             return False
+
+    def wait_for_interrupt(self):
+        """
+        Block until the user presses Ctrl+C, which raises KeyboardInterrupt.
         
-        # Handle multiple files if specified, otherwise load single file
-        if self.args.files:
-            if not self.load_multiple_files():
-                return False
+        On POSIX systems the process sleeps in signal.pause() without waking up.
+        Windows has no signal.pause(), and waiting on an Event there cannot be
+        interrupted by Ctrl+C, so it keeps a one-second sleep loop instead.
+        """
+        while True:
+            if hasattr(signal, 'pause'):
+                signal.pause()
+            else:
+                time.sleep(1)
+
+    def type_into_page(self):
+        """
+        Find the editor on the current page, insert the loaded content and verify it.
+        
+        Returns:
+            bool: True if the content was inserted, False otherwise
+        """
+        # Load previous session if available
+        if not self.args.no_session:
+            self.load_session()
+        
+        # Wait for an editor to appear when unattended, otherwise for the user to confirm
+        if self.args.unattended:
+            self.wait_for_page_ready()
+        else:
+            input("\nPress Enter when the page is fully loaded and you're ready to start typing...")
+        
+        # Check for and handle multiple editors if requested
+        editor = None
+        if self.args.detect_multiple:
+            editor = self.handle_multiple_editors()
+        else:
+            # Find and focus the editor
+            editor = self.find_and_focus_editor()
+            
+            # If standard method fails, try the new multi-editor finder
+            if not editor:
+                editors = self.find_editor()
+                if editors:
+                    print(f"Found {len(editors)} alternative editors")
+                    if len(editors) == 1:
+                        editor_type, editor, frame = editors[0]
+                        if frame:
+                            self.driver.switch_to.frame(frame)
+                        print(f"Using {editor_type} editor")
+                    else:
+                        # Let user choose which editor to use
+                        print("Multiple editors found. Please select:")
+                        for idx, (editor_type, _, _) in enumerate(editors):
+                            print(f"{idx+1}. {editor_type}")
+                        try:
+                            choice = int(input("Enter editor number: ")) - 1
+                            if 0 <= choice < len(editors):
+                                editor_type, editor, frame = editors[choice]
+                                if frame:
+                                    self.driver.switch_to.frame(frame)
+                                print(f"Using {editor_type} editor")
+                            else:
+                                print("Invalid choice")
+                        except ValueError:
+                            print("Invalid input")
+        
+        if not editor:
+            return False
+        
+        success = False
+        
+        # Try clipboard method first if not disabled
+        if not self.args.no_clipboard:
+            clipboard_success = self.try_clipboard_paste(editor)
+            if clipboard_success:
+                success = True
+        
+        # If clipboard failed or was disabled, try typing methods
+        if not success:
+            success = self.insert_content(editor)
+        
+        if not success:
+            print("\nTyping process encountered errors")
+            return False
+        
+        # Verify content if verification is not disabled
+        if not self.args.no_verification:
+            verification = self.verify_typed_content(editor, self.content)
+            
+            # Retype only the part after the last matching character, as often as requested
+            while not verification and self.retry_position is not None:
+                print(f"\nRetyping content from character {self.retry_position}...")
+                self.progress = self.retry_position
+                self.retry_position = None
+                retyped = self.insert_content(editor)
+                verification = retyped and self.verify_typed_content(editor, self.content)
+            
+            if not verification:
+                print("Warning: Content verification failed")
+        
+        return True
+
+    def insert_content(self, editor):
+        """
+        Type the loaded content with the insertion method chosen on the command line.
+        
+        Args:
+            editor: The editor WebElement to type into
+            
+        Returns:
+            bool: True if the content was inserted, False otherwise
+        """
+        if self.args.batch:
+            # Use batched typing for better performance
+            return self.type_content_batched(editor, self.content)
+        elif self.args.formatted:
+            return self.type_formatted_content(editor, self.content)
         else:
-            if not self.load_content_from_file():
+            return self.type_content(editor, self.content)
+
+    def insertion_resumes(self):
+        """
+        Check whether insert_content can continue from self.progress.
+        
+        Batched and plain typing keep the content before self.progress and append
+        the rest, while type_formatted_content always rewrites the whole document.
+        HTML content is escaped by both resumable paths, so it would never match
+        the editor markup it is verified against.
+        
+        Returns:
+            bool: True if a retry can retype just the part after self.progress
+        """
+        if self.is_html:
+            return False
+        return self.args.batch or not self.args.formatted
+
+    def type_files_separately(self):
+        """
+        Type each file given with --files into its own load of the URL, reusing one browser.
+        
+        The first file is expected to be loaded and its page open already. Before each
+        following file the user gets to review and submit the typed page, then the
+        typing state is reset and the URL is loaded again.
+        
+        Returns:
+            bool: True if every file was inserted, False otherwise
+        """
+        all_typed = True
+        for index, file_path in enumerate(self.args.files):
+            print(f"\n--- File {index + 1} of {len(self.args.files)}: {file_path} ---")
+            if index > 0:
+                # Loading the URL again discards the previous document, so let the user submit it first
+                input("Review and submit the typed page, then press Enter to load the next file...")
+                
+                self.args.file = file_path
+                self.progress = 0
+                self.retry_position = None
+                self.paste_method = None
+                self.editor_found = False
+                if not self.load_content_from_file():
+                    all_typed = False
+                    continue
+                
+                try:
+                    self.driver.switch_to.default_content()
+                    print(f"Loading page: {self.args.url}")
+                    self.driver.get(self.args.url)
+                except WebDriverException as e:
+                    # For example a beforeunload dialog or a page load timeout
+                    print(f"Error loading page for {file_path}: {e.msg}")
+                    all_typed = False
+                    continue
+            
+            if self.type_into_page():
+                print(f"Finished typing {file_path}")
+            else:
+                all_typed = False
+                print(f"Could not type {file_path}")
+        return all_typed
+
+    def run(self):
+        """Main execution method."""
+        # Handle multiple files if specified, otherwise load single file. Loading runs in
+        # the background so it overlaps with starting or connecting to the browser.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if self.args.separate_files:
+                # Files are typed one at a time, starting with the first
+                self.args.file = self.args.files[0]
+                content_loaded = executor.submit(self.load_content_from_file)
+            elif self.args.files:
+                content_loaded = executor.submit(self.load_multiple_files)
+            else:
+                content_loaded = executor.submit(self.load_content_from_file)
+            
+            if not self.setup_browser():
+                return False
+            
+            if not content_loaded.result():
                 return False
         
         try:
@@ -1000,93 +1920,29 @@ class TinyMCETyper:
                         self.driver.get(self.args.url)
                         print("Page loaded successfully")
             
-            # Load previous session if available
-            if not self.args.no_session:
-                self.load_session()
-            
-            # Wait for user to confirm the page is ready
-            input("\nPress Enter when the page is fully loaded and you're ready to start typing...")
-            
-            # Check for and handle multiple editors if requested
-            editor = None
-            if self.args.detect_multiple:
-                editor = self.handle_multiple_editors()
+            # Type each file into its own page load, or the loaded content once
+            if self.args.separate_files:
+                success = self.type_files_separately()
             else:
-                # Find and focus the editor
-                editor = self.find_and_focus_editor()
-                
-                # If standard method fails, try the new multi-editor finder
-                if not editor:
-                    editors = self.find_editor()
-                    if editors:
-                        print(f"Found {len(editors)} alternative editors")
-                        if len(editors) == 1:
-                            editor_type, editor, frame = editors[0]
-                            if frame:
-                                self.driver.switch_to.frame(frame)
-                            print(f"Using {editor_type} editor")
-                        else:
-                            # Let user choose which editor to use
-                            print("Multiple editors found. Please select:")
-                            for idx, (editor_type, _, _) in enumerate(editors):
-                                print(f"{idx+1}. {editor_type}")
-                            try:
-                                choice = int(input("Enter editor number: ")) - 1
-                                if 0 <= choice < len(editors):
-                                    editor_type, editor, frame = editors[choice]
-                                    if frame:
-                                        self.driver.switch_to.frame(frame)
-                                    print(f"Using {editor_type} editor")
-                                else:
-                                    print("Invalid choice")
-                            except ValueError:
-                                print("Invalid input")
-            
-            if editor:
-                success = False
-                
-                # Try clipboard method first if not disabled
-                if not self.args.no_clipboard:
-                    clipboard_success = self.try_clipboard_paste(editor)
-                    if clipboard_success:
-                        success = True
-                
-                # If clipboard failed or was disabled, try typing methods
-                if not success:
-                    if self.args.batch:
-                        # Use batched typing for better performance
-                        success = self.type_content_batched(editor, self.content)
-                    elif self.args.formatted:
-                        success = self.type_formatted_content(editor, self.content)
-                    else:
-                        success = self.type_content(editor, self.content)
+                success = self.type_into_page()
+            
+            if success:
+                print("\nTyping completed successfully!")
+                print("You can now manually review and submit the form")
                 
-                if success:
-                    # Verify content if verification is not disabled
-                    if not self.args.no_verification:
-                        verification = self.verify_typed_content(editor, self.content)
-                        if not verification:
-                            print("Warning: Content verification failed")
-                    
-                    print("\nTyping completed successfully!")
-                    print("You can now manually review and submit the form")
-                    
-                    # Don't close browser if we're using an existing session
-                    if self.args.use_existing:
-                        print("\nKeeping existing browser session open")
-                        print("Script will now exit, browser will remain running")
-                    else:
-                        print("\nThe browser will remain open until you close this script")
-                        print("Press Ctrl+C in this terminal to exit the script and close the browser")
-                        
-                        # Keep the script running until manually terminated
-                        try:
-                            while True:
-                                time.sleep(1)
-                        except KeyboardInterrupt:
-                            print("\nScript terminated by user")
+                # Don't close browser if we're using an existing session
+                if self.args.use_existing:
+                    print("\nKeeping existing browser session open")
+                    print("Script will now exit, browser will remain running")
                 else:
-                    print("\nTyping process encountered errors")
+                    print("\nThe browser will remain open until you close this script")
+                    print("Press Ctrl+C in this terminal to exit the script and close the browser")
+                    
+                    # Keep the script running until manually terminated
+                    try:
+                        self.wait_for_interrupt()
+                    except KeyboardInterrupt:
+                        print("\nScript terminated by user")
             
         except KeyboardInterrupt:
             print("\nScript terminated by user")
@@ -1097,8 +1953,7 @@ class TinyMCETyper:
             if not self.args.use_existing:
                 print("\nReminder: Press Ctrl+C to quit and close the browser")
                 try:
-                    while True:
-                        time.sleep(1)
+                    self.wait_for_interrupt()
                 except KeyboardInterrupt:
                     print("\nExiting and closing browser")
                     self.driver.quit()
@@ -1117,7 +1972,15 @@ def parse_arguments():
     parser.add_argument('--browser', choices=['chrome', 'firefox'], default='chrome',
                         help='Browser to use (default: chrome)')
     parser.add_argument('--profile', default='',
-                        help='Path to browser profile directory')
+                        help='Path to browser profile directory (default: a profile kept in ~/.cache/tinymce_typer)')
+    parser.add_argument('--fresh-profile', action='store_true',
+                        help='Start with a temporary profile instead of the one kept between runs')
+    parser.add_argument('--driver-path', default=None,
+                        help='Path to a chromedriver or geckodriver to use instead of resolving one with Selenium Manager')
+    parser.add_argument('--no-images', action='store_true',
+                        help='Do not load images in a newly started browser, reducing rendering work')
+    parser.add_argument('--lean', action='store_true',
+                        help='Start a newly launched browser without GPU, extensions, sync and first-run checks')
     
     # Editor location options
     parser.add_argument('--iframe-id', default='', 
@@ -1126,20 +1989,30 @@ def parse_arguments():
                         help='ID of the TinyMCE editor element (if known)')
     parser.add_argument('--detect-multiple', action='store_true',
                         help='Detect and select from multiple TinyMCE editors')
+    parser.add_argument('--unattended', action='store_true',
+                        help='Wait for an editor to load instead of prompting to press Enter')
+    parser.add_argument('--page-timeout', type=float, default=PAGE_TIMEOUT,
+                        help=f'Seconds to wait for an editor with --unattended (default: {PAGE_TIMEOUT})')
     
     # Content insertion options
     parser.add_argument('--type-delay', type=float, default=0.01,
-                        help='Delay between keystrokes in seconds (default: 0.01)')
+                        help='Delay between keystrokes in seconds with --human-typing (default: 0.01)')
+    parser.add_argument('--human-typing', action='store_true',
+                        help='Type content gradually with keystroke delays instead of inserting it at once')
+    parser.add_argument('--type-chunk-size', type=int, default=TYPE_CHUNK_SIZE,
+                        help=f'Number of characters typed per editor update with --human-typing (default: {TYPE_CHUNK_SIZE})')
     parser.add_argument('--formatted', action='store_true',
                         help='Preserve HTML formatting in the content')
     parser.add_argument('--no-clipboard', action='store_true',
                         help='Disable clipboard paste attempt')
+    parser.add_argument('--no-clipboard-restore', action='store_true',
+                        help='Do not save and restore the clipboard around paste attempts')
     parser.add_argument('--batch', action='store_true',
                         help='Use batch insertion for better performance')
     parser.add_argument('--batch-size', type=int, default=50,
                         help='Number of characters to insert at once (default: 50)')
-    parser.add_argument('--batch-delay', type=float, default=0.1,
-                        help='Delay between batch insertions in seconds (default: 0.1)')
+    parser.add_argument('--batch-delay', type=float, default=None,
+                        help='Delay between batch insertions in seconds (default: no delay)')
     
     # Session handling options
     parser.add_argument('--no-session', action='store_true',
@@ -1168,8 +2041,17 @@ def parse_arguments():
                         help='Multiple content files to type sequentially')
     parser.add_argument('--file-separator', default='\n\n',
                         help='Separator to use between content from multiple files')
+    parser.add_argument('--separate-files', action='store_true',
+                        help='Type each of --files into its own load of the URL in the same browser instead of combining them')
+    
+    args = parser.parse_args()
+    if args.separate_files and not args.files:
+        parser.error("--separate-files requires --files")
+    if args.separate_files and args.unattended:
+        # Nothing would submit each page before the next file reloads it
+        parser.error("--separate-files cannot be combined with --unattended")
     
-    return parser.parse_args()
+    return args
 
 
 # Main script entry point